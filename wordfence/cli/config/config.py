@@ -15,6 +15,7 @@ class Config(SimpleNamespace):
                 ini_path: Optional[str] = None
             ):
         super().__init__()
+        self._visible_keys = {}
         self._definitions = definitions
         self._parser = parser
         self.subcommand = subcommand
@@ -23,14 +24,21 @@ class Config(SimpleNamespace):
         self.defaulted_options = set()
         self.sources = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith('_'):
+            return
+        if callable(value) or isinstance(value, classmethod):
+            self._visible_keys.pop(name, None)
+        else:
+            self._visible_keys[name] = None
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        self._visible_keys.pop(name, None)
+
     def values(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = dict()
-        for prop, value in vars(self).items():
-            if (prop.startswith('_') or callable(value) or
-                    isinstance(value, classmethod)):
-                continue
-            result[prop] = value
-        return result
+        return {key: getattr(self, key) for key in self._visible_keys}
 
     def get(self, property_name, default=None) -> Any:
         return getattr(self, property_name, default)
@@ -113,11 +113,15 @@ class CliContext:
         return license
 
     def filter_cache_entry(self, value: Any) -> Any:
-        if isinstance(value, LicenseSpecific):
-            if not value.is_compatible_with_license(self.require_license()):
-                raise InvalidCachedValueException(
-                        'Incompatible license'
-                    )
+        if not isinstance(value, LicenseSpecific):
+            return value
+        license = self._license
+        if license is None:
+            license = self.require_license()
+        if not value.is_compatible_with_license(license):
+            raise InvalidCachedValueException(
+                    'Incompatible license'
+                )
         return value
 
     def create_noc1_client(
@@ -29,6 +29,17 @@ config_definitions: ConfigDefinitions = {
         "default": False,
         "category": "Output Control"
     },
+    "workers": {
+        "short_name": "w",
+        "description": "Number of files to remediate concurrently. Defaults "
+                       "to 1 worker thread.",
+        "context": "ALL",
+        "argument_type": "OPTION",
+        "default": 1,
+        "meta": {
+            "value_type": int
+        }
+    },
     "require-path": {
         "description": "When enabled, invoking the remediate command without "
                        "specifying at least one path will trigger an error. "
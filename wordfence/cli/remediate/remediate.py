@@ -1,9 +1,17 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Iterable
+
 from ...wordpress.remediator import Remediator, Noc1RemediationSource
 from ...logging import log
 from ..subcommands import Subcommand
 from ..exceptions import ConfigurationException
+from ..io import IoManager
 from .reporting import RemediationReportManager, RemediationReport
 
+MAX_PENDING_FILES_PER_WORKER = 2
+
 
 class RemediateSubcommand(Subcommand):
 
@@ -12,38 +20,73 @@ class RemediateSubcommand(Subcommand):
                 Noc1RemediationSource(self.context.get_noc1_client())
             )
 
-    def process_path(self, path: str, report: RemediationReport) -> None:
-        log.debug(f'Attempting to remediate {path}...')
-        for result in self.remediator.remediate(path):
-            report.add_result(result)
+    def _get_paths(self, io_manager: IoManager) -> Iterable[str]:
+        paths = self.config.trailing_arguments
+        if io_manager.should_read_stdin():
+            reader = io_manager.get_input_reader()
+            paths = chain(paths, reader.read_all_entries())
+        return paths
+
+    def _process_paths_concurrently(
+                self,
+                paths: Iterable[str],
+                report: RemediationReport,
+                workers: int
+            ) -> None:
+        # Directories are split into a task per file, tasks are submitted in a
+        # bounded window so inputs are still consumed incrementally and
+        # results are added to the report in input order from this thread
+        max_pending = workers * MAX_PENDING_FILES_PER_WORKER
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for path in paths:
+                    for task in self.remediator.get_remediation_tasks(path):
+                        pending.append(executor.submit(task))
+                        if len(pending) >= max_pending:
+                            report.add_result(pending.popleft().result())
+                while pending:
+                    report.add_result(pending.popleft().result())
+            except BaseException:
+                # Stop remediating queued files once processing has failed
+                for future in pending:
+                    future.cancel()
+                raise
 
     def invoke(self) -> int:
+        workers = self.config.workers
+        if workers < 1:
+            raise ConfigurationException(
+                    'At least one worker must be specified'
+                )
         report_manager = RemediationReportManager(self.context)
         io_manager = report_manager.get_io_manager()
         with report_manager.open_output_file() as output_file:
             report = report_manager.initialize_report(output_file)
-            for path in self.config.trailing_arguments:
-                self.process_path(path, report)
-            if io_manager.should_read_stdin():
-                reader = io_manager.get_input_reader()
-                for path in reader.read_all_entries():
-                    self.process_path(path, report)
+            paths = self._get_paths(io_manager)
+            if workers == 1:
+                for path in paths:
+                    for result in self.remediator.remediate(path):
+                        report.add_result(result)
+            else:
+                self._process_paths_concurrently(paths, report, workers)
             if self.remediator.input_count == 0 and \
                     self.context.requires_input(self.config.require_path):
                 raise ConfigurationException(
                         'At least one path to remediate must be specified'
                     )
             report.complete()
-            if report.counts.remediated == report.counts.total:
+            counts = report.counts
+            remediated = counts.remediated
+            total = counts.total
+            if remediated == total:
                 log.info(
-                        f'{report.counts.remediated} file(s) were successfully'
-                        ' remediated'
+                        f'{remediated} file(s) were successfully remediated'
                     )
             else:
                 log.error(
-                    f'{report.counts.remediated} of {report.counts.total} '
-                    'file(s) were successfully remediated, '
-                    f'{report.counts.unsuccessful} file(s) could not be '
+                    f'{remediated} of {total} file(s) were successfully '
+                    f'remediated, {counts.unsuccessful} file(s) could not be '
                     'remediated'
                 )
                 return 1
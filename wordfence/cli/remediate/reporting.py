@@ -1,4 +1,5 @@
 from typing import List, Optional, Dict
+from operator import attrgetter, methodcaller
 from email.message import EmailMessage
 from email.headerregistry import Address
 
@@ -15,28 +16,41 @@ from ..reporting import ReportColumnEnum, Report, ReportManager, \
 from ..context import CliContext
 
 
+def _get_site_path(record) -> Optional[str]:
+    site = record.result.identity.site
+    return site.core_path if site is not None else None
+
+
+def _get_wordpress_version(record) -> Optional[str]:
+    site = record.result.identity.site
+    return site.get_version() if site is not None else None
+
+
+def _get_extension_slug(record) -> Optional[str]:
+    extension = record.result.identity.extension
+    return extension.slug if extension is not None else None
+
+
+def _get_extension_name(record) -> Optional[str]:
+    extension = record.result.identity.extension
+    return extension.get_name() if extension is not None else None
+
+
+def _get_extension_version(record) -> Optional[str]:
+    extension = record.result.identity.extension
+    return extension.version if extension is not None else None
+
+
 class RemediationReportColumn(ReportColumnEnum):
-    PATH = 'path', lambda record: record.result.path,
-    STATUS = 'status', lambda record: record.get_status(),
-    TYPE = 'type', lambda record: record.result.identity.type,
-    SITE = 'site', \
-        lambda record: record.result.identity.site.core_path \
-        if record.result.identity.site is not None \
-        else None
-    TARGET_PATH = 'target_path', lambda record: record.result.target_path,
-    WORDPRESS_VERSION = 'wordpress_version', \
-        lambda record: record.result.identity.site.get_version() \
-        if record.result.identity.site is not None \
-        else None
-    EXTENSION_SLUG = 'extension_slug', \
-        lambda record: record.result.identity.extension.slug \
-        if record.result.identity.extension is not None else None
-    EXTENSION_NAME = 'extension_name', \
-        lambda record: record.result.identity.extension.get_name() \
-        if record.result.identity.extension is not None else None
-    EXTENSION_VERSION = 'extension_version', \
-        lambda record: record.result.identity.extension.version \
-        if record.result.identity.extension is not None else None
+    PATH = 'path', attrgetter('result.path')
+    STATUS = 'status', methodcaller('get_status')
+    TYPE = 'type', attrgetter('result.identity.type')
+    SITE = 'site', _get_site_path
+    TARGET_PATH = 'target_path', attrgetter('result.target_path')
+    WORDPRESS_VERSION = 'wordpress_version', _get_wordpress_version
+    EXTENSION_SLUG = 'extension_slug', _get_extension_slug
+    EXTENSION_NAME = 'extension_name', _get_extension_name
+    EXTENSION_VERSION = 'extension_version', _get_extension_version
 
 
 class HumanReadableWriter(BaseHumanReadableWriter):
@@ -75,6 +89,8 @@ class RemediationReportFormat(ReportFormatEnum):
 
 class RemediationReportRecord(ReportRecord):
 
+    __slots__ = ('result',)
+
     def __init__(self, result: RemediationResult):
         self.result = result
 
@@ -90,6 +106,8 @@ class RemediationReportRecord(ReportRecord):
 
 class RemediationCounts:
 
+    __slots__ = ('total', 'remediated', 'known', 'unknown')
+
     def __init__(self):
         self.total = 0
         self.remediated = 0
@@ -97,13 +115,13 @@ class RemediationCounts:
         self.unknown = 0
 
     def add(self, result: RemediationResult):
-        if result.remediated:
-            self.remediated += 1
+        self.total += 1
         if result.identity.type is FileType.UNKNOWN:
             self.unknown += 1
         else:
             self.known += 1
-        self.total += 1
+            if result.remediated:
+                self.remediated += 1
 
     @property
     def unsuccessful(self):
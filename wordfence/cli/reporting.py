@@ -204,7 +204,7 @@ class ReportFormatEnum(Enum):
 
 
 class ReportRecord:
-    pass
+    __slots__ = ()
 
 
 def generate_html_table(results: Dict[str, Any]) -> Tag:
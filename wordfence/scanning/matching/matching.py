@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 from importlib import import_module
+from functools import lru_cache
 from contextlib import AbstractContextManager
 
 from ...intel.signatures import SignatureSet
@@ -36,9 +37,13 @@ class MatchWorkspace(AbstractContextManager):
 class MatcherContext(AbstractContextManager):
 
     def __init__(self):
-        self.matches = {}
+        self._matches = {}
         self.timeouts = set()
 
+    @property
+    def matches(self) -> Dict[int, str]:
+        return self._matches
+
     def process_chunk(
                 self,
                 chunk: bytes,
@@ -50,8 +55,8 @@ class MatcherContext(AbstractContextManager):
     def finalize_content(self) -> None:
         pass
 
-    def _record_match(self, identifier: str, matched: str) -> None:
-        self.matches[identifier] = matched
+    def _record_match(self, identifier: int, matched: str) -> None:
+        self._matches[identifier] = matched
 
     def __enter__(self):
         return self
@@ -144,14 +149,14 @@ class MatchEngine(Enum):
 
     @classmethod
     def get_options(cls) -> List:
-        return [engine.option for engine in cls]
+        return list(_get_engines_by_option().keys())
 
     @classmethod
     def for_option(cls, option: str):
-        for engine in cls:
-            if engine.option == option:
-                return engine
-        raise ValueError(f'Unrecognized engine option: {option}')
+        try:
+            return _get_engines_by_option()[option]
+        except KeyError:
+            raise ValueError(f'Unrecognized engine option: {option}')
 
     @classmethod
     def get_default(cls):
@@ -192,3 +197,8 @@ class MatchEngine(Enum):
     def create_matcher(self, options: MatchEngineOptions) -> Matcher:
         module = self._get_loaded_module()
         return module.create_matcher(options)
+
+
+@lru_cache(maxsize=1)
+def _get_engines_by_option() -> Dict[str, MatchEngine]:
+    return {engine.option: engine for engine in MatchEngine}
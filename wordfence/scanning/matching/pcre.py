@@ -106,7 +106,7 @@ class PcreMatcherContext(BaseMatcherContext):
                         )
             if self.common_string_states[index]:
                 for identifier in common_string.common_string.signature_ids:
-                    if identifier in self.matches:
+                    if identifier in self._matches:
                         continue
                     if identifier in common_string_counts:
                         common_string_counts[identifier] += 1
@@ -0,0 +1,32 @@
+import unittest
+
+from ...intel.signatures import Signature, SignatureSet
+from ...util import vectorscan
+
+
+@unittest.skipUnless(vectorscan.AVAILABLE, 'Vectorscan is not available')
+class TestVectorscanMatcherContext(unittest.TestCase):
+
+    def setUp(self):
+        from .vectorscan import VectorscanMatcher
+        signature_set = SignatureSet(
+                [],
+                {1: Signature(1, 'needle', 'Test', 'Test signature')}
+            )
+        self.matcher = VectorscanMatcher(signature_set)
+        self.matcher.prepare(thread=True)
+
+    def test_match(self):
+        with self.matcher.create_context() as context:
+            self.assertTrue(context.process_chunk(b'a needle'))
+            context.finalize_content()
+        self.assertEqual(context.matches, {1: ''})
+
+    def test_exit_without_finalizing(self):
+        with self.matcher.create_context() as context:
+            context.process_chunk(b'partial content ending with nee')
+        with self.matcher.create_context() as context:
+            self.assertFalse(context.process_chunk(b'dle'))
+            context.finalize_content()
+        self.assertEqual(context.matches, {})
+
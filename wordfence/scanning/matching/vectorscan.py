@@ -1,4 +1,5 @@
-from typing import Optional
+from array import array
+from typing import Dict, Optional
 
 from ...intel.signatures import SignatureSet
 from ...logging import log
@@ -23,17 +24,21 @@ class VectorscanMatcherContext(BaseMatcherContext):
 
     def __init__(self, matcher: Matcher):
         super().__init__(matcher)
-        self.matched = None
+        self._signatures = matcher.signature_set.signatures
+        self._match_ids = array('I')
+        self._finalized = False
+
+    @property
+    def matches(self) -> Dict[int, str]:
+        # Vectorscan does not report the matched content, so the mapping is
+        # only built from the recorded identifiers when it is requested
+        return dict.fromkeys(self._match_ids, '')
 
     def _match_callback(self, match: VectorscanMatch) -> bool:
-        if not self.matcher.signature_set.has_signature(match.identifier):
+        if match.identifier not in self._signatures:
             return False
-        self._record_match(
-                identifier=match.identifier,
-                matched=''
-            )
-        self.matched = True
-        return False if self.matcher.match_all else True
+        self._match_ids.append(match.identifier)
+        return not self.matcher.match_all
 
     def process_chunk(
                 self,
@@ -41,22 +46,26 @@ class VectorscanMatcherContext(BaseMatcherContext):
                 start: bool = False,
                 workspace: Optional[MatchWorkspace] = None
             ) -> bool:
-        self.matched = False
+        match_count = len(self._match_ids)
         try:
             self.matcher.scanner.scan(chunk)
         except VectorscanScanTerminated:
-            return True
-        return self.matched
+            pass
+        return len(self._match_ids) > match_count
 
     def finalize_content(self) -> None:
         self.matcher.scanner.reset()
+        self._finalized = True
 
     def __enter__(self):
         self.matcher.scanner.set_callback(self._match_callback)
         return super().__enter__()
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        pass
+        if not self._finalized:
+            # The stream is shared by all files processed by the thread, so
+            # the state of a partially scanned file must not carry over
+            self.matcher.scanner.reset(report_matches=False)
 
 
 class VectorscanCompiler(Compiler):
@@ -1,7 +1,8 @@
-from ctypes import Structure, POINTER, c_char_p, c_int, \
+from array import array
+from ctypes import Structure, POINTER, c_char, c_char_p, c_int, \
     c_void_p, c_uint, c_ulonglong, c_size_t, byref, string_at, CFUNCTYPE
 from enum import IntFlag, IntEnum
-from typing import Dict, Optional, Callable, Union, Any
+from typing import Dict, Optional, Callable, Union, Any, Tuple
 
 from ..library import load_library, LibraryNotAvailableException
 from .. import signals
@@ -10,6 +11,8 @@ from .vectorscan import VectorscanException, \
     VectorscanLibraryNotAvailableException
 
 
+# libhs is loaded as a CDLL (not a PyDLL) so the GIL is released for the
+# duration of each call and reacquired by ctypes when a match callback fires
 try:
     hs = load_library('hs')
 except LibraryNotAvailableException:
@@ -116,12 +119,15 @@ _match_event_handler = CFUNCTYPE(
         c_uint,
         c_void_p
     )
+# ctypes only accepts a function pointer instance for callback arguments,
+# so discarding matches requires an explicit NULL pointer rather than None
+_NO_MATCH_HANDLER = _match_event_handler()
 
 
 _hs_scan = hs.hs_scan
 _hs_scan.argtypes = [
         _hs_database_p,
-        c_char_p,
+        c_void_p,
         c_uint,
         c_uint,
         _hs_scratch_p,
@@ -150,7 +156,7 @@ _hs_open_stream.restype = _hs_error
 _hs_scan_stream = hs.hs_scan_stream
 _hs_scan_stream.argtypes = [
         _hs_stream_p,
-        c_char_p,
+        c_void_p,
         c_uint,
         c_uint,
         _hs_scratch_p,
@@ -243,6 +249,8 @@ DATABASE_COMPATIBILITY_ERRORS = [
 
 
 def _assert_success(error: Union[int, _hs_error]):
+    if error == VectorscanErrorType.SUCCESS:
+        return
     try:
         if isinstance(error, _hs_error):
             error = _hs_error.value
@@ -314,6 +322,8 @@ class VectorscanScratch:
 
 class VectorscanMatch:
 
+    __slots__ = ('identifier', 'start', 'end', 'context')
+
     def __init__(
                 self,
                 identifier: int,
@@ -328,14 +338,45 @@ class VectorscanMatch:
 
 
 VectorscanMatchCallback = Callable[[VectorscanMatch], bool]
+ScanData = Union[bytes, str, bytearray]
+
+
+# Arguments on the scan path are passed as plain Python values and
+# converted by the argtypes declarations rather than wrapping each one in a
+# new ctypes object per call
+_NO_FLAGS = 0
 
 
 def _default_match_callback(match: VectorscanMatch) -> bool:
     return False
 
 
-def _wrap_match_callback(callback: VectorscanMatchCallback, context: Any):
-    def wrapped_callback(
+class VectorscanScanner:
+
+    def __init__(
+                self,
+                database: VectorscanDatabase,
+                scratch: Optional[VectorscanScratch] = None
+            ):
+        self.database = database
+        self.scratch = scratch if scratch is not None \
+            else VectorscanScratch(database)
+        self._py_callback = _default_match_callback
+        self._py_context = None
+        # The C trampoline is created once per scanner and reused for every
+        # scan, the active Python callback is swapped in by _set_py_callback
+        self._c_callback = _match_event_handler(self._dispatch)
+
+    def _set_py_callback(
+                self,
+                callback: VectorscanMatchCallback,
+                context: Optional[Any] = None
+            ) -> None:
+        self._py_callback = callback
+        self._py_context = context
+
+    def _dispatch(
+                self,
                 identifier: int,
                 start: int,
                 end: int,
@@ -346,28 +387,25 @@ def _wrap_match_callback(callback: VectorscanMatchCallback, context: Any):
                 identifier,
                 start,
                 end,
-                context
+                self._py_context
             )
-        should_terminate = callback(match)
+        should_terminate = self._py_callback(match)
         return 1 if should_terminate else 0
-    return wrapped_callback
-
-
-class VectorscanScanner:
-
-    def __init__(
-                self,
-                database: VectorscanDatabase,
-                scratch: Optional[VectorscanScratch] = None
-            ):
-        self.database = database
-        self.scratch = scratch if scratch is not None \
-            else VectorscanScratch(database)
 
-    def _encode_data(self, data: Union[bytes, str]) -> bytes:
+    def _prepare_data(self, data: ScanData) -> Tuple[Any, int]:
         if isinstance(data, str):
             data = data.encode('utf-8')
-        return data
+        if isinstance(data, bytes):
+            return data, len(data)
+        # Writable buffers are passed without copying, ctypes cannot expose
+        # the address of other read-only buffers
+        view = memoryview(data)
+        if view.readonly:
+            raise TypeError(
+                    'Scan data must be bytes, str or a writable buffer'
+                )
+        length = view.nbytes
+        return (c_char * length).from_buffer(view), length
 
 
 class VectorscanBlockScanner(VectorscanScanner):
@@ -381,22 +419,22 @@ class VectorscanBlockScanner(VectorscanScanner):
 
     def scan(
                 self,
-                data: Union[bytes, str],
+                data: ScanData,
                 callback: VectorscanMatchCallback,
                 context: Optional[Any] = None
             ):
-        data = self._encode_data(data)
+        data, length = self._prepare_data(data)
 
-        callback = _wrap_match_callback(callback, context)
+        self._set_py_callback(callback, context)
 
         error = _hs_scan(
                 self.database._database,
-                c_char_p(data),
-                c_uint(len(data)),
-                c_uint(0),
+                data,
+                length,
+                _NO_FLAGS,
                 self.scratch._scratch,
-                _match_event_handler(callback),
-                c_void_p()
+                self._c_callback,
+                None
             )
         _assert_success(error)
 
@@ -420,15 +458,13 @@ class VectorscanStreamScanner(VectorscanScanner):
                 callback: VectorscanMatchCallback,
                 context: Optional[Any] = None
             ) -> None:
-        self._callback = _match_event_handler(
-                _wrap_match_callback(callback, context)
-            )
+        self._set_py_callback(callback, context)
 
     def _open_stream(self) -> None:
         stream = _hs_stream_p()
         error = _hs_open_stream(
                 self.database._database,
-                c_uint(0),
+                _NO_FLAGS,
                 byref(stream)
             )
         _assert_success(error)
@@ -440,37 +476,37 @@ class VectorscanStreamScanner(VectorscanScanner):
         error = _hs_close_stream(
                 self._stream,
                 self.scratch._scratch,
-                self._callback,
-                c_void_p()
+                self._c_callback,
+                None
             )
         _assert_success(error)
         self._stream = None
 
     def scan(
                 self,
-                data: Union[bytes, str]
+                data: ScanData
             ) -> None:
-        data = self._encode_data(data)
+        data, length = self._prepare_data(data)
         error = _hs_scan_stream(
                 self._stream,
-                c_char_p(data),
-                c_uint(len(data)),
-                c_uint(0),
+                data,
+                length,
+                _NO_FLAGS,
                 self.scratch._scratch,
-                self._callback,
-                c_void_p()
+                self._c_callback,
+                None
             )
         _assert_success(error)
 
-    def reset(self) -> None:
+    def reset(self, report_matches: bool = True) -> None:
         if self._stream is None:
             self._open_stream()
         error = _hs_reset_stream(
                 self._stream,
-                c_uint(0),
+                _NO_FLAGS,
                 self.scratch._scratch,
-                self._callback,
-                c_void_p()
+                self._c_callback if report_matches else _NO_MATCH_HANDLER,
+                None
             )
         _assert_success(error)
 
@@ -512,24 +548,31 @@ class VectorscanPlatformInfo:
             )
 
 
+def _encode_expression(expression: Union[str, bytes]) -> bytes:
+    if isinstance(expression, bytes):
+        return expression
+    return expression.encode('utf-8')
+
+
 def vectorscan_compile(
-            patterns: Dict[int, str],
+            patterns: Dict[int, Union[str, bytes]],
             mode: VectorscanMode = VectorscanMode.BLOCK,
             flags: VectorscanFlags = VectorscanFlags.NONE,
             platform_info: Optional[VectorscanPlatformInfo] = None
         ) -> VectorscanDatabase:
     database = _hs_database_p()
     compiler_error = _hs_compile_error_p()
-    ids = [c_uint(id) for id in patterns.keys()]
-    ids = (c_uint * len(ids))(*ids)
-    expressions = [
-            c_char_p(expression.encode('utf-8')) for expression
-            in patterns.values()
-        ]
-    expressions = (c_char_p * len(expressions))(*expressions)
-    c_flags = (c_uint * len(ids))()
-    for i in range(0, len(ids)):
-        c_flags[i] = c_uint(flags)
+    count = len(patterns)
+    # The id and flag arrays are filled by array.array and then shared with
+    # ctypes via from_buffer to avoid creating a c_uint object per pattern
+    id_buffer = array('I', patterns.keys())
+    ids = (c_uint * count).from_buffer(id_buffer)
+    flag_buffer = array('I', [flags]) * count
+    c_flags = (c_uint * count).from_buffer(flag_buffer)
+    # The c_char_p array keeps its own references to the encoded patterns
+    expressions = (c_char_p * count)(
+            *map(_encode_expression, patterns.values())
+        )
     signals.reset()
     platform_info_p = _hs_platform_info_p() if platform_info is None \
         else byref(platform_info._platform_info)
@@ -537,7 +580,7 @@ def vectorscan_compile(
             expressions,
             c_flags,
             ids,
-            c_uint(len(patterns)),
+            c_uint(count),
             c_uint(mode),
             platform_info_p,
             byref(database),
@@ -1,12 +1,41 @@
+import os
+from bisect import bisect_left, bisect_right
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, List, Union
 from pathlib import Path
 
-from ..util.io import pathlib_resolve
-from .site import WordpressSite
+from .site import WordpressSite, is_core_directory
 from .exceptions import WordpressException
 from .extension import Extension
 
+PATH_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _resolve_directory(path: str) -> str:
+    return os.path.realpath(path)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _prepare_path(path: str) -> str:
+    # Files that are not symlinks resolve to their resolved parent directory
+    # plus their name, so siblings share the cost of resolving the parent
+    if not os.path.islink(path):
+        parent, name = os.path.split(path)
+        if name not in ('', os.curdir, os.pardir):
+            return os.path.join(_resolve_directory(parent), name)
+    return os.path.realpath(path)
+
+
+def prepare_path(path: Union[str, Path]) -> str:
+    # Relative paths depend on the working directory, so only absolute paths
+    # are cached
+    path = os.path.expanduser(os.fspath(path))
+    if not os.path.isabs(path):
+        path = os.path.join(os.getcwd(), path)
+    return _prepare_path(path)
+
 
 class FileType(str, Enum):
     CORE = 'core'
@@ -17,6 +46,8 @@ class FileType(str, Enum):
 
 class FileIdentity:
 
+    __slots__ = ('type', 'site', 'extension')
+
     def __init__(
                 self,
                 type: FileType,
@@ -30,36 +61,72 @@ class FileIdentity:
     def is_final(self) -> bool:
         return False
 
+    def materialize_for(self, path: str) -> 'FileIdentity':
+        return self
+
 
 class GroupIdentity(FileIdentity):
 
+    __slots__ = ('path', 'final', '_root_identity')
+
     def __init__(
                 self,
                 type: FileType,
-                path: Path,
+                path: Union[str, Path],
                 site: Optional[WordpressSite] = None,
                 extension: Optional[Extension] = None,
                 final: bool = False
             ):
         super().__init__(type, site, extension)
-        self.path = path
+        self.path = os.fspath(path)
         self.final = final
+        self._root_identity = None
 
     def is_final(self) -> bool:
         return self.final
 
+    def _create_identity(self, path: str) -> 'KnownFileIdentity':
+        return KnownFileIdentity(
+                self.type,
+                path,
+                self.path,
+                self.site,
+                self.extension
+            )
+
+    def materialize_for(self, path: str) -> 'KnownFileIdentity':
+        if path != self.path:
+            return self._create_identity(path)
+        if self._root_identity is None:
+            self._root_identity = self._create_identity(path)
+        return self._root_identity
+
 
 class KnownFileIdentity(FileIdentity):
 
+    __slots__ = ('path', 'group_path', '_local_path')
+
     def __init__(
                 self,
                 type: FileType,
-                local_path: str,
+                path: str,
+                group_path: str,
                 site: Optional[WordpressSite] = None,
                 extension: Optional[Extension] = None,
             ):
         super().__init__(type, site, extension)
-        self.local_path = local_path
+        self.path = path
+        self.group_path = group_path
+        self._local_path = None
+
+    @property
+    def local_path(self) -> str:
+        # Only needed for reporting and remediation, so computed on demand
+        if self._local_path is None:
+            self._local_path = os.path.relpath(self.path, self.group_path) \
+                if self.path != self.group_path \
+                else os.path.basename(self.path)
+        return self._local_path
 
     def is_final(self) -> bool:
         return True
@@ -74,134 +141,179 @@ class KnownFileIdentity(FileIdentity):
         return f'{self.local_path} of {self.type.value} {software} ({version})'
 
 
+_UNKNOWN_IDENTITY = FileIdentity(FileType.UNKNOWN)
+
+
 class KnownPath:
 
-    def __init__(
+    __slots__ = ('identities', '_prefix_keys', '_prefix_identities')
+
+    def __init__(self):
+        self.identities: Dict[str, FileIdentity] = {}
+        # Final groups (plugins and themes) match all of their descendants,
+        # including any groups nested within them, so each prefix maps to
+        # the identity of its outermost enclosing final group
+        self._prefix_keys: List[str] = []
+        self._prefix_identities: List[FileIdentity] = []
+
+    def _find_final_prefix(self, key: str) -> int:
+        index = bisect_right(self._prefix_keys, key) - 1
+        while index >= 0:
+            candidate = self._prefix_keys[index]
+            if key.startswith(candidate):
+                return index
+            # Any prefix of the key that sorts before the candidate is also a
+            # prefix of the candidate, so the search continues from the
+            # directories they share
+            common = os.path.commonprefix((key, candidate))
+            common = common[:common.rfind(os.sep) + 1]
+            index = bisect_right(self._prefix_keys, common) - 1
+        return -1
+
+    def _add_final_prefix(self, key: str, identity: FileIdentity) -> None:
+        prefix = key.rstrip(os.sep) + os.sep
+        outer = self._find_final_prefix(prefix[:-1])
+        if outer >= 0:
+            identity = self._prefix_identities[outer]
+        index = bisect_left(self._prefix_keys, prefix)
+        if index == len(self._prefix_keys) or \
+                self._prefix_keys[index] != prefix:
+            self._prefix_keys.insert(index, prefix)
+            self._prefix_identities.insert(index, identity)
+        while index < len(self._prefix_keys) and \
+                self._prefix_keys[index].startswith(prefix):
+            self._prefix_identities[index] = identity
+            index += 1
+
+    def find_identity(
                 self,
-                identity: Optional[FileIdentity] = None
-            ):
-        self.identity = identity
-        self.children = {}
-
-    def is_root(self) -> bool:
-        return self.path is None
-
-    def find_identity(self, path: Path) -> Optional[FileIdentity]:
-        node = self
-        path = pathlib_resolve(path)
-        identity = None
-        for component in path.parts:
-            if node.identity is not None:
-                identity = node.identity
-                if node.identity.is_final():
-                    break
-            try:
-                node = node.children[component]
-            except KeyError:
-                break
-        if node.identity is not None:
-            return node.identity
-        return identity
+                path: Union[str, Path]
+            ) -> Optional[FileIdentity]:
+        key = prepare_path(path)
+        index = self._find_final_prefix(key)
+        if index >= 0:
+            return self._prefix_identities[index]
+        identity = self.identities.get(key)
+        if identity is not None:
+            return identity
+        index = len(key)
+        while (index := key.rfind(os.sep, 0, index)) > 0:
+            identity = self.identities.get(key[:index])
+            if identity is not None:
+                return identity
+        return self.identities.get(os.sep)
 
     def set_identity(
                 self,
-                path: Path,
+                path: Union[str, Path],
                 identity: FileIdentity,
                 resolve: bool = True
             ) -> None:
-        node = self
-        if resolve:
-            path = pathlib_resolve(path)
-        for component in path.parts:
-            if component not in node.children:
-                node.children[component] = KnownPath()
-            node = node.children[component]
-        node.identity = identity
+        key = prepare_path(path) if resolve else os.fspath(path)
+        self.identities[key] = identity
+        if identity.is_final() and isinstance(identity, GroupIdentity):
+            self._add_final_prefix(key, identity)
 
-    def __str__(self) -> str:
-        if self.identity is None:
-            return 'Unknown Path'
-        else:
-            final = self.identity.is_final()
-            return f'Known Path: {self.identity.type}, {final}'
-
-    def debug(self, indent: str = '') -> None:
-        print(indent + str(self))
-        for path, child in self.children.items():
-            print(indent + f' {path}')
-            child.debug(indent + '\t')
+    def debug(self) -> None:
+        for key, identity in sorted(self.identities.items()):
+            final = identity.is_final()
+            print(f'{key}: Known Path: {identity.type}, {final}')
 
 
 class FileIdentifier:
 
     def __init__(self):
         self.known_paths = KnownPath()
+        self._last_parent: Optional[str] = None
+        self._last_parent_identity: Optional[GroupIdentity] = None
+        # The site containing each directory searched during discovery, or
+        # None if neither it nor any of its ancestors is a WordPress core
+        self._ancestor_site_cache: Dict[str, Optional[WordpressSite]] = {}
 
-    def _identify_new_path(self, path: Path):
-        try:
-            site = WordpressSite(
-                        str(path),
-                        is_child_path=True,
-                        allow_io_errors=True
-                    )
-            core_path = Path(site.core_path)
+    def _add_site(self, site: WordpressSite) -> None:
+        core_path = os.fspath(site.core_path)
+        self.known_paths.set_identity(
+                core_path,
+                GroupIdentity(
+                    type=FileType.CORE,
+                    path=core_path,
+                    site=site
+                )
+            )
+        for plugin in site.get_all_plugins():
             self.known_paths.set_identity(
-                    core_path,
+                    plugin.path,
                     GroupIdentity(
-                        type=FileType.CORE,
-                        path=core_path,
-                        site=site
-                    )
+                        type=FileType.PLUGIN,
+                        path=plugin.path,
+                        site=site,
+                        extension=plugin,
+                        final=True
+                    ),
+                    resolve=False
                 )
-            for plugin in site.get_all_plugins():
-                self.known_paths.set_identity(
-                        plugin.path,
-                        GroupIdentity(
-                            type=FileType.PLUGIN,
-                            path=plugin.path,
-                            site=site,
-                            extension=plugin,
-                            final=True
-                        ),
-                        resolve=False
-                    )
-            for theme in site.get_themes():
-                self.known_paths.set_identity(
-                        theme.path,
-                        GroupIdentity(
-                            type=FileType.THEME,
-                            path=theme.path,
-                            site=site,
-                            extension=theme,
-                            final=True
-                        ),
-                        resolve=False
-                    )
-        except WordpressException:
+        for theme in site.get_themes():
             self.known_paths.set_identity(
-                    path,
-                    FileIdentity(
-                        type=FileType.UNKNOWN
-                    )
+                    theme.path,
+                    GroupIdentity(
+                        type=FileType.THEME,
+                        path=theme.path,
+                        site=site,
+                        extension=theme,
+                        final=True
+                    ),
+                    resolve=False
                 )
 
-    def identify(self, path: Path, identify_new: bool = True) -> FileIdentity:
-        identity = self.known_paths.find_identity(path)
+    def preload(self, root: Union[str, Path]) -> bool:
+        return self._locate_site(prepare_path(root)) is not None
+
+    def _locate_site(self, directory: str) -> Optional[WordpressSite]:
+        searched = []
+        site = None
+        while directory not in self._ancestor_site_cache:
+            searched.append(directory)
+            if is_core_directory(directory, allow_io_errors=True):
+                try:
+                    site = WordpressSite(directory, allow_io_errors=True)
+                    self._add_site(site)
+                except WordpressException:
+                    site = None
+                break
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        else:
+            site = self._ancestor_site_cache[directory]
+        for directory in searched:
+            self._ancestor_site_cache[directory] = site
+        return site
+
+    def _identify_new_path(self, key: str) -> Optional[FileIdentity]:
+        directory = key if os.path.isdir(key) else os.path.dirname(key)
+        if self._locate_site(directory) is None:
+            return _UNKNOWN_IDENTITY
+        return self.known_paths.find_identity(key)
+
+    def identify(
+                self,
+                path: Union[str, Path],
+                identify_new: bool = True
+            ) -> FileIdentity:
+        key = prepare_path(path)
+        parent = os.path.dirname(key)
+        # Files are typically identified in directory order, so the final
+        # group containing the previous file's directory is checked first
+        if parent == self._last_parent:
+            identity = self._last_parent_identity
+        else:
+            identity = self.known_paths.find_identity(key)
+        if identity is None and identify_new:
+            identity = self._identify_new_path(key)
         if identity is None:
-            if identify_new:
-                self._identify_new_path(path)
-                return self.identify(path, False)
-            else:
-                return FileIdentity(FileType.UNKNOWN)
-        elif isinstance(identity, GroupIdentity):
-            local_path = path.relative_to(identity.path) \
-                    if path != identity.path \
-                    else path.name
-            identity = KnownFileIdentity(
-                    identity.type,
-                    local_path,
-                    identity.site,
-                    identity.extension
-                )
-            self.known_paths.set_identity(path, identity)
-        return identity
+            return _UNKNOWN_IDENTITY
+        if identity.is_final() and key != identity.path:
+            self._last_parent = parent
+            self._last_parent_identity = identity
+        return identity.materialize_for(key)
@@ -1,5 +1,7 @@
-from typing import Optional
+from functools import partial
+from typing import Optional, Callable, Generator
 from pathlib import Path
+from threading import Lock
 
 from ..util.io import pathlib_resolve, iterate_files
 from ..logging import log
@@ -77,6 +79,9 @@ class Remediator:
         self.identifier = FileIdentifier()
         self.source = source
         self.input_count = 0
+        # Guards the shared identifier cache and counters when remediating
+        # from multiple threads
+        self._lock = Lock()
 
     def get_correct_content(self, identity: KnownFileIdentity) -> bytes:
         return self.source.get_correct_content(identity)
@@ -86,7 +91,8 @@ class Remediator:
                 path: Path,
                 target_path: Optional[Path] = None
             ) -> RemediationResult:
-        identity = self.identifier.identify(path)
+        with self._lock:
+            identity = self.identifier.identify(path)
         result = RemediationResult(path, identity, target_path=target_path)
         if identity.type is FileType.UNKNOWN:
             log.warning(f'Unable to identify {path}')
@@ -115,21 +121,36 @@ class Remediator:
     def handle_symlink_loop(self, path: str) -> None:
         log.warning(f'Symlink loop detected at {path}')
 
-    def remediate(self, path: str) -> RemediationResult:
-        self.input_count += 1
+    def get_remediation_tasks(
+                self,
+                path: str
+            ) -> Generator[Callable[[], RemediationResult], None, None]:
+        log.debug(f'Attempting to remediate {path}...')
+        with self._lock:
+            self.input_count += 1
         path = pathlib_resolve(path)
         if path.is_dir():
+            with self._lock:
+                self.identifier.preload(path)
             file_found = False
             for file in iterate_files(
                         path,
                         loop_callback=self.handle_symlink_loop
                     ):
-                yield self.remediate_file(pathlib_resolve(file), path)
+                yield partial(self.remediate_file, pathlib_resolve(file), path)
                 file_found = True
             if not file_found:
-                yield RemediationResult(
+                yield partial(
+                        RemediationResult,
                         path,
                         GroupIdentity(FileType.UNKNOWN, path)
                     )
         else:
-            yield self.remediate_file(path)
+            yield partial(self.remediate_file, path)
+
+    def remediate(
+                self,
+                path: str
+            ) -> Generator[RemediationResult, None, None]:
+        for task in self.get_remediation_tasks(path):
+            yield task()
@@ -203,6 +203,11 @@ class WordpressLocator(PathResolver):
         return None
 
 
+def is_core_directory(path: str, allow_io_errors: bool = False) -> bool:
+    locator = WordpressLocator(path, allow_io_errors=allow_io_errors)
+    return locator._is_core_directory(path)
+
+
 def locate_core_path(
             path: str,
             up: bool = False,
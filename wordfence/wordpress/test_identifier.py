@@ -0,0 +1,77 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from .identifier import FileIdentifier, FileType
+
+
+class TestFileIdentifier(unittest.TestCase):
+
+    def _write_file(self, path: str, content: str = '') -> str:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    def _create_site(self, path: str, version: str) -> None:
+        for name in ['wp-blog-header.php', 'wp-load.php', 'index.php']:
+            self._write_file(os.path.join(path, name))
+        os.makedirs(os.path.join(path, 'wp-admin'))
+        self._write_file(
+                os.path.join(path, 'wp-includes', 'version.php'),
+                f"<?php\n$wp_version = '{version}';\n"
+            )
+        os.makedirs(os.path.join(path, 'wp-content', 'themes'))
+
+    def _create_plugin(self, site: str, slug: str, name: str) -> str:
+        return self._write_file(
+                os.path.join(
+                    site, 'wp-content', 'plugins', slug, f'{slug}.php'
+                ),
+                f'<?php\n/*\nPlugin Name: {name}\nVersion: 1.0\n*/\n'
+            )
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.site = os.path.realpath(self.directory.name)
+        self._create_site(self.site, '6.4.1')
+        self.outer_plugin = self._create_plugin(self.site, 'foo', 'Foo')
+        self.nested_site = os.path.join(
+                os.path.dirname(self.outer_plugin),
+                'vendor',
+                'wp'
+            )
+        self._create_site(self.nested_site, '5.0')
+        self.nested_plugin = self._create_plugin(
+                self.nested_site,
+                'zed',
+                'Zed'
+            )
+        self.nested_files = [
+                self._write_file(os.path.join(self.nested_site, name))
+                for name in ['a.php', 'z.php']
+            ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _assert_outer_plugin(self, identifier: FileIdentifier, path: str):
+        identity = identifier.identify(path)
+        self.assertIs(identity.type, FileType.PLUGIN)
+        self.assertEqual(identity.extension.get_name(), 'Foo')
+
+    def test_nested_site_within_plugin(self):
+        identifier = FileIdentifier()
+        identifier.identify(self.nested_plugin)
+        self._assert_outer_plugin(identifier, self.outer_plugin)
+        core = identifier.identify(os.path.join(self.site, 'index.php'))
+        self.assertIs(core.type, FileType.CORE)
+        for path in self.nested_files + [self.nested_plugin]:
+            self._assert_outer_plugin(identifier, path)
+
+    def test_nested_site_preloaded(self):
+        identifier = FileIdentifier()
+        self.assertTrue(identifier.preload(self.nested_site))
+        self.assertTrue(identifier.preload(self.site))
+        for path in [self.nested_plugin] + self.nested_files:
+            self._assert_outer_plugin(identifier, path)